@@ -1,15 +1,158 @@
+import hashlib
+import sqlite3
+from datetime import datetime
 from flask import Flask, request, jsonify
 from flask_migrate import Migrate
 from flask_restful import Api, Resource
+from sqlalchemy import event, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import raiseload, selectinload
+from sqlalchemy_serializer import SerializerMixin
 from models import db, User, Job, JobApplication, Payment, ExtraResource
 
 app = Flask(__name__)
 app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///Job.db'
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+# flask_restful indents JSON in debug mode, which forces the pure-Python
+# encoder; keep output compact so json.dumps always uses the C encoder.
+# Keys are sorted because the serializer builds them from sets, and the
+# ETag below must not change with each process's hash seed.
+app.config['RESTFUL_JSON'] = {'indent': None, 'separators': (',', ':'), 'sort_keys': True}
 db.init_app(app)
 migrate = Migrate(app, db)
+api = Api(app)
 
-if __name__ == '__main__':
-    app.run(debug=True)
+
+@event.listens_for(Engine, 'connect')
+def set_sqlite_pragmas(dbapi_connection, connection_record):
+    # WAL lets readers proceed while a writer holds the database.
+    if isinstance(dbapi_connection, sqlite3.Connection):
+        cursor = dbapi_connection.cursor()
+        cursor.execute('PRAGMA journal_mode=WAL')
+        cursor.execute('PRAGMA synchronous=NORMAL')
+        cursor.execute('PRAGMA cache_size=-65536')
+        cursor.execute('PRAGMA temp_store=MEMORY')
+        cursor.close()
+
+
+@app.after_request
+def add_etag(response):
+    # Let clients revalidate JSON with If-None-Match and get an empty 304 back.
+    # Files, streams and handlers that set their own ETag are left alone.
+    if (
+        request.method != 'GET'
+        or response.status_code != 200
+        or not response.is_json
+        or response.direct_passthrough
+        or response.is_streamed
+        or response.get_etag()[0]
+    ):
+        return response
+    response.set_etag(hashlib.blake2b(response.get_data(), digest_size=16).hexdigest())
+    response.make_conditional(request)
+    return response
+
+
+# Eager-load everything each model's serialize_rules will walk, so to_dict
+# never falls back to one lazy SELECT per row. raiseload('*') turns any
+# relationship left off these lists into an error instead of a hidden query.
+USER_LOADERS = (
+    selectinload(User.payments),
+    selectinload(User.applications).selectinload(JobApplication.job),
+    raiseload('*'),
+)
+JOB_LOADERS = (
+    selectinload(Job.applications).selectinload(JobApplication.user),
+    selectinload(Job.extra_resources),
+    raiseload('*'),
+)
+PAYMENT_LOADERS = (selectinload(Payment.user), raiseload('*'))
+
+
+# Listings that would repeat the same job or user in every row return flat
+# column projections instead; clients join on the *_id fields.
+def row_to_dict(row):
+    return {
+        key: value.strftime(SerializerMixin.datetime_format) if isinstance(value, datetime) else value
+        for key, value in row._mapping.items()
+    }
+
+
+class Users(Resource):
+    def get(self):
+        users = db.session.execute(select(User).options(*USER_LOADERS)).scalars().all()
+        return [user.to_dict() for user in users], 200
+
+
+class UserById(Resource):
+    def get(self, id):
+        user = db.session.get(User, id, options=USER_LOADERS)
+        if not user:
+            return {"error": "User not found"}, 404
+        return user.to_dict(), 200
 
 
+class Jobs(Resource):
+    def get(self):
+        jobs = db.session.execute(select(Job).options(*JOB_LOADERS)).scalars().all()
+        return [job.to_dict() for job in jobs], 200
+
+
+class JobById(Resource):
+    def get(self, id):
+        job = db.session.get(Job, id, options=JOB_LOADERS)
+        if not job:
+            return {"error": "Job not found"}, 404
+        return job.to_dict(), 200
+
+
+class JobApplications(Resource):
+    def get(self):
+        rows = db.session.execute(
+            select(
+                JobApplication.id,
+                JobApplication.status,
+                JobApplication.application_date,
+                JobApplication.user_id,
+                User.username,
+                JobApplication.job_id,
+                Job.title.label('job_title'),
+            )
+            .join(JobApplication.user)
+            .join(JobApplication.job)
+        )
+        return [row_to_dict(row) for row in rows], 200
+
+
+class Payments(Resource):
+    def get(self):
+        payments = db.session.execute(select(Payment).options(*PAYMENT_LOADERS)).scalars().all()
+        return [payment.to_dict() for payment in payments], 200
+
+
+class ExtraResources(Resource):
+    def get(self):
+        rows = db.session.execute(
+            select(
+                ExtraResource.id,
+                ExtraResource.resource_name,
+                ExtraResource.description,
+                ExtraResource.resource_type,
+                ExtraResource.job_id,
+                Job.title.label('job_title'),
+            )
+            .join(ExtraResource.job)
+        )
+        return [row_to_dict(row) for row in rows], 200
+
+
+api.add_resource(Users, '/users')
+api.add_resource(UserById, '/users/<int:id>')
+api.add_resource(Jobs, '/jobs')
+api.add_resource(JobById, '/jobs/<int:id>')
+api.add_resource(JobApplications, '/applications')
+api.add_resource(Payments, '/payments')
+api.add_resource(ExtraResources, '/extra_resources')
+
+if __name__ == '__main__':
+    app.run(debug=True)
@@ -0,0 +1,141 @@
+"""align schema with models
+
+Revision ID: 5c2e8d1f4a7b
+Revises: 8183a75af4be
+Create Date: 2026-10-15 21:20:04.512318
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5c2e8d1f4a7b'
+down_revision = '8183a75af4be'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # The initial migration was generated from an older set of models
+    # (user_id/name, job_id/job_name, ...) that no longer exist. Replace
+    # those tables with the ones defined in models.py.
+    op.drop_table('payments')
+    op.drop_table('job_applications')
+    op.drop_table('users')
+    op.drop_table('jobs')
+    op.drop_table('extra_resources')
+
+    # ### commands auto generated by Alembic - please adjust! ###
+    op.create_table('jobs',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('title', sa.String(length=120), nullable=False),
+    sa.Column('description', sa.Text(), nullable=False),
+    sa.Column('location', sa.String(length=100), nullable=False),
+    sa.Column('salary_min', sa.Float(), nullable=True),
+    sa.Column('salary_max', sa.Float(), nullable=True),
+    sa.Column('job_type', sa.String(length=50), nullable=False),
+    sa.Column('skills_required', sa.String(length=255), nullable=True),
+    sa.Column('benefits', sa.Text(), nullable=True),
+    sa.Column('application_deadline', sa.DateTime(), nullable=False),
+    sa.Column('employer', sa.String(length=100), nullable=False),
+    sa.Column('employer_email', sa.String(length=120), nullable=False),
+    sa.Column('employer_phone', sa.String(length=20), nullable=True),
+    sa.Column('date_posted', sa.DateTime(), nullable=True),
+    sa.Column('is_active', sa.Boolean(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('users',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('username', sa.String(length=80), nullable=False),
+    sa.Column('email', sa.String(length=120), nullable=False),
+    sa.Column('phone', sa.String(length=20), nullable=True),
+    sa.Column('password_hash', sa.String(length=128), nullable=False),
+    sa.Column('role', sa.String(length=50), nullable=False),
+    sa.Column('date_joined', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('email'),
+    sa.UniqueConstraint('username')
+    )
+    op.create_table('extra_resources',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('job_id', sa.Integer(), nullable=False),
+    sa.Column('resource_name', sa.String(length=120), nullable=False),
+    sa.Column('description', sa.Text(), nullable=True),
+    sa.Column('resource_type', sa.String(length=50), nullable=False),
+    sa.ForeignKeyConstraint(['job_id'], ['jobs.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('job_applications',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('job_id', sa.Integer(), nullable=False),
+    sa.Column('application_date', sa.DateTime(), nullable=True),
+    sa.Column('status', sa.String(length=50), nullable=True),
+    sa.ForeignKeyConstraint(['job_id'], ['jobs.id'], ),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('payments',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('amount', sa.Float(), nullable=False),
+    sa.Column('payment_date', sa.DateTime(), nullable=True),
+    sa.Column('payment_status', sa.String(length=50), nullable=True),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    # ### end Alembic commands ###
+
+
+def downgrade():
+    # ### commands auto generated by Alembic - please adjust! ###
+    op.drop_table('payments')
+    op.drop_table('job_applications')
+    op.drop_table('extra_resources')
+    op.drop_table('users')
+    op.drop_table('jobs')
+    # ### end Alembic commands ###
+    op.create_table('extra_resources',
+    sa.Column('resource_id', sa.Integer(), nullable=False),
+    sa.Column('title', sa.String(length=255), nullable=False),
+    sa.Column('description', sa.Text(), nullable=False),
+    sa.PrimaryKeyConstraint('resource_id')
+    )
+    op.create_table('jobs',
+    sa.Column('job_id', sa.Integer(), nullable=False),
+    sa.Column('job_name', sa.String(length=255), nullable=False),
+    sa.Column('job_description', sa.Text(), nullable=False),
+    sa.Column('location', sa.String(length=255), nullable=False),
+    sa.Column('requirements', sa.Text(), nullable=False),
+    sa.Column('salary', sa.Numeric(precision=10, scale=2), nullable=False),
+    sa.Column('posted_date', sa.TIMESTAMP(), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=False),
+    sa.Column('expiration_date', sa.TIMESTAMP(), nullable=False),
+    sa.PrimaryKeyConstraint('job_id')
+    )
+    op.create_table('users',
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('role', sa.String(length=20), nullable=False),
+    sa.Column('name', sa.String(length=255), nullable=False),
+    sa.Column('email', sa.String(length=255), nullable=False),
+    sa.Column('password_hash', sa.String(length=255), nullable=False),
+    sa.PrimaryKeyConstraint('user_id'),
+    sa.UniqueConstraint('email')
+    )
+    op.create_table('job_applications',
+    sa.Column('application_id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('job_id', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['job_id'], ['jobs.job_id'], ),
+    sa.ForeignKeyConstraint(['user_id'], ['users.user_id'], ),
+    sa.PrimaryKeyConstraint('application_id')
+    )
+    op.create_table('payments',
+    sa.Column('payment_id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('amount', sa.Numeric(precision=10, scale=2), nullable=False),
+    sa.Column('payment_date', sa.TIMESTAMP(), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=False),
+    sa.Column('payment_method', sa.String(length=50), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['users.user_id'], ),
+    sa.PrimaryKeyConstraint('payment_id')
+    )
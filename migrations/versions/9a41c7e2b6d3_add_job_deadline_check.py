@@ -0,0 +1,26 @@
+"""add job deadline check
+
+Revision ID: 9a41c7e2b6d3
+Revises: 5c2e8d1f4a7b
+Create Date: 2026-10-15 21:24:37.108945
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9a41c7e2b6d3'
+down_revision = '5c2e8d1f4a7b'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('jobs', schema=None) as batch_op:
+        batch_op.create_check_constraint('ck_jobs_deadline_after_posted', 'application_deadline > date_posted')
+
+
+def downgrade():
+    with op.batch_alter_table('jobs', schema=None) as batch_op:
+        batch_op.drop_constraint('ck_jobs_deadline_after_posted', type_='check')
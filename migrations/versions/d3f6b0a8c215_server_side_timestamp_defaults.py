@@ -0,0 +1,41 @@
+"""server side timestamp defaults
+
+Revision ID: d3f6b0a8c215
+Revises: 80f043b4f99a
+Create Date: 2026-10-15 21:31:52.640218
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd3f6b0a8c215'
+down_revision = '80f043b4f99a'
+branch_labels = None
+depends_on = None
+
+TIMESTAMP_COLUMNS = (
+    ('users', 'date_joined'),
+    ('jobs', 'date_posted'),
+    ('job_applications', 'application_date'),
+    ('payments', 'payment_date'),
+)
+
+
+def upgrade():
+    for table, column in TIMESTAMP_COLUMNS:
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.alter_column(column,
+                   existing_type=sa.DateTime(),
+                   server_default=sa.text('(CURRENT_TIMESTAMP)'),
+                   existing_nullable=True)
+
+
+def downgrade():
+    for table, column in TIMESTAMP_COLUMNS:
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.alter_column(column,
+                   existing_type=sa.DateTime(),
+                   server_default=None,
+                   existing_nullable=True)
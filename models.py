@@ -1,32 +1,50 @@
+from flask_sqlalchemy import SQLAlchemy
 from sqlalchemy import MetaData, event
 from sqlalchemy.orm import validates, relationship
 from sqlalchemy_serializer import SerializerMixin
+from werkzeug.security import generate_password_hash, check_password_hash
 from datetime import datetime
-import re
 
-# Initialize the SQLAlchemy object
-db = SQLAlchemy(metadata=MetaData())
+# Initialize the SQLAlchemy object. Objects stay loaded after commit so a
+# handler can serialize what it just saved without re-selecting it; the
+# session is removed at the end of each request, so never keep instances
+# around across requests.
+db = SQLAlchemy(metadata=MetaData(), session_options={'expire_on_commit': False})
 
+VALID_JOB_TYPES = frozenset(('Full-time', 'Part-time', 'Contract', 'Internship', 'Temporary'))
+VALID_APPLICATION_STATUSES = frozenset(('pending', 'accepted', 'rejected'))
+
+
+# Same acceptance as re.match(r"[^@]+@[^@]+\.[^@]+") using plain str.find calls
+def _is_valid_email(email):
+    at = email.find('@')
+    end = email.find('@', at + 1)
+    if end == -1:
+        end = len(email)
+    dot = email.find('.', at + 2, end)
+    return at > 0 and dot != -1 and dot < end - 1
 
 
 # Base User class for common attributes
 class User(db.Model, SerializerMixin):
     __tablename__ = 'users'
+    serialize_rules = ('-password_hash', '-payments.user', '-applications.user')
 
     id = db.Column(db.Integer, primary_key=True)
     username = db.Column(db.String(80), unique=True, nullable=False)
     email = db.Column(db.String(120), unique=True, nullable=False)
     phone = db.Column(db.String(20), nullable=True)
-    password_hash = db.Column(db.String(128), nullable=False)
+    # Only needed by check_password, so keep it out of every other SELECT
+    password_hash = db.deferred(db.Column(db.String(128), nullable=False))
     role = db.Column(db.String(50), nullable=False, default="graduate")
-    date_joined = db.Column(db.DateTime, default=datetime.utcnow)
+    date_joined = db.Column(db.DateTime, server_default=db.func.now())
 
-    payments = db.relationship('Payment', back_populates='user', lazy=True, overlaps="user_payment")
-    applications = db.relationship('JobApplication', back_populates='user', lazy=True, overlaps="user_application")
+    payments = db.relationship('Payment', back_populates='user', lazy='select', overlaps="user_payment")
+    applications = db.relationship('JobApplication', back_populates='user', lazy='select', overlaps="user_application")
 
     @validates('email')
     def validate_email(self, key, email):
-        if not re.match(r"[^@]+@[^@]+\.[^@]+", email):
+        if not _is_valid_email(email):
             raise ValueError("Invalid email address.")
         return email
 
@@ -36,28 +54,29 @@ class User(db.Model, SerializerMixin):
             raise ValueError("Username must be at least 3 characters long.")
         return username
 
-    def to_dict(self):
-        user_dict = {
-            "username": self.username,
-            "email": self.email,
-            "phone": self.phone,
-            "role": self.role,
-            "date_joined": self.date_joined,
-            "payments": [payment.to_dict() for payment in self.payments],
-            "applications": [app.to_dict() for app in self.applications]
-        }
-        return user_dict
+    # method is werkzeug's hash spec; only fixtures should pass a cheaper one
+    def set_password(self, password, method='scrypt'):
+        self.password_hash = generate_password_hash(password, method=method)
+
+    def check_password(self, password):
+        return check_password_hash(self.password_hash, password)
 
 # Job model with employer contact information
 class Job(db.Model, SerializerMixin):
     __tablename__ = 'jobs'
+    # Database-side guard for writes that bypass the validator below (bulk
+    # inserts, raw SQL); validate_application_deadline still rejects past deadlines.
+    __table_args__ = (
+        db.CheckConstraint('application_deadline > date_posted', name='ck_jobs_deadline_after_posted'),
+    )
+    serialize_rules = ('-applications.job', '-extra_resources.job')
 
     id = db.Column(db.Integer, primary_key=True)
     title = db.Column(db.String(120), nullable=False)
     description = db.Column(db.Text, nullable=False)
     location = db.Column(db.String(100), nullable=False)
-    salary_min = db.Column(db.Float, nullable=True)
-    salary_max = db.Column(db.Float, nullable=True)
+    salary_min = db.Column(db.Integer, nullable=True)
+    salary_max = db.Column(db.Integer, nullable=True)
     job_type = db.Column(db.String(50), nullable=False)
     skills_required = db.Column(db.String(255), nullable=True)
     benefits = db.Column(db.Text, nullable=True)
@@ -65,15 +84,20 @@ class Job(db.Model, SerializerMixin):
     employer = db.Column(db.String(100), nullable=False)
     employer_email = db.Column(db.String(120), nullable=False)
     employer_phone = db.Column(db.String(20), nullable=True)
-    date_posted = db.Column(db.DateTime, default=datetime.utcnow)
+    date_posted = db.Column(db.DateTime, server_default=db.func.now())
     is_active = db.Column(db.Boolean, default=True)
 
-    applications = db.relationship('JobApplication', back_populates='job', lazy=True)
-    extra_resources = db.relationship('ExtraResource', back_populates='job', lazy=True)
+    applications = db.relationship('JobApplication', back_populates='job', lazy='select')
+    extra_resources = db.relationship('ExtraResource', back_populates='job', lazy='select')
 
     @validates('salary_min', 'salary_max')
     def validate_salary(self, key, salary):
-        if salary is not None and salary < 0:
+        if salary is None:
+            return salary
+        # Stored as whole shillings; SQLite would keep a float as REAL
+        if not isinstance(salary, int) or isinstance(salary, bool):
+            raise ValueError("Salary must be a whole number of shillings.")
+        if salary < 0:
             raise ValueError("Salary must be a positive number.")
         return salary
 
@@ -85,147 +109,63 @@ class Job(db.Model, SerializerMixin):
 
     @validates('job_type')
     def validate_job_type(self, key, job_type):
-        valid_job_types = ['Full-time', 'Part-time', 'Contract', 'Internship', 'Temporary']
-        if job_type not in valid_job_types:
-            raise ValueError(f"Invalid job type. Allowed types: {', '.join(valid_job_types)}.")
+        if job_type not in VALID_JOB_TYPES:
+            raise ValueError(f"Invalid job type. Allowed types: {', '.join(sorted(VALID_JOB_TYPES))}.")
         return job_type
 
-    def to_dict(self):
-        job_dict = {
-            "title": self.title,
-            "description": self.description,
-            "location": self.location,
-            "salary_min": self.salary_min,
-            "salary_max": self.salary_max,
-            "job_type": self.job_type,
-            "skills_required": self.skills_required,
-            "benefits": self.benefits,
-            "application_deadline": self.application_deadline,
-            "employer": self.employer,
-            "employer_email": self.employer_email,
-            "employer_phone": self.employer_phone,
-            "date_posted": self.date_posted,
-            "is_active": self.is_active,
-            "applications": [application.to_dict() for application in self.applications],
-            "extra_resources": [resource.to_dict() for resource in self.extra_resources]
-        }
-        return job_dict
-
 # JobApplication model
 class JobApplication(db.Model, SerializerMixin):
     __tablename__ = 'job_applications'
+    # Leads with user_id, so it also serves the User.applications lookups
+    __table_args__ = (
+        db.Index('ix_job_applications_user_id_job_id', 'user_id', 'job_id'),
+    )
+    serialize_rules = ('-user.applications', '-user.payments', '-job.applications', '-job.extra_resources')
 
     id = db.Column(db.Integer, primary_key=True)
     user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
-    job_id = db.Column(db.Integer, db.ForeignKey('jobs.id'), nullable=False)
-    application_date = db.Column(db.DateTime, default=datetime.utcnow)
+    job_id = db.Column(db.Integer, db.ForeignKey('jobs.id'), nullable=False, index=True)
+    application_date = db.Column(db.DateTime, server_default=db.func.now())
     status = db.Column(db.String(50), default="pending")
 
-    user = db.relationship('User', back_populates='applications', lazy=True)
-    job = db.relationship('Job', back_populates='applications', lazy=True)
+    user = db.relationship('User', back_populates='applications', lazy='select')
+    job = db.relationship('Job', back_populates='applications', lazy='select')
 
     @validates('status')
     def validate_status(self, key, status):
-        if status not in ["pending", "accepted", "rejected"]:
+        if status not in VALID_APPLICATION_STATUSES:
             raise ValueError("Invalid application status.")
         return status
 
-    def to_dict(self):
-        app_dict = {
-            "application_date": self.application_date,
-            "status": self.status,
-            "user": {
-                "username": self.user.username,
-                "email": self.user.email,
-                "phone": self.user.phone,
-                "role": self.user.role,
-                "date_joined": self.user.date_joined
-            },
-            "job": {
-                "title": self.job.title,
-                "description": self.job.description,
-                "location": self.job.location,
-                "salary_min": self.job.salary_min,
-                "salary_max": self.job.salary_max,
-                "job_type": self.job.job_type,
-                "skills_required": self.job.skills_required,
-                "benefits": self.job.benefits,
-                "application_deadline": self.job.application_deadline,
-                "employer": self.job.employer,
-                "employer_email": self.job.employer_email,
-                "employer_phone": self.job.employer_phone,
-                "date_posted": self.job.date_posted,
-                "is_active": self.job.is_active
-            }
-        }
-        return app_dict
-
 # Payment model with fixed 5000 amount
 class Payment(db.Model, SerializerMixin):
     __tablename__ = 'payments'
+    serialize_rules = ('-user.payments', '-user.applications')
 
     id = db.Column(db.Integer, primary_key=True)
-    user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
-    amount = db.Column(db.Float, nullable=False, default=5000)
-    payment_date = db.Column(db.DateTime, default=datetime.utcnow)
+    user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False, index=True)
+    amount = db.Column(db.Integer, nullable=False, default=5000)
+    payment_date = db.Column(db.DateTime, server_default=db.func.now())
     payment_status = db.Column(db.String(50), default="completed")
 
-    user = db.relationship('User', back_populates='payments', lazy=True)
+    user = db.relationship('User', back_populates='payments', lazy='select')
 
     @validates('amount')
     def validate_amount(self, key, amount):
         # Ensure the amount is always 5000
-        if amount != 5000:
+        if not isinstance(amount, int) or isinstance(amount, bool) or amount != 5000:
             raise ValueError("Payment amount must always be 5000.")
         return amount
 
-    def to_dict(self):
-        payment_dict = {
-            "amount": self.amount,
-            "payment_date": self.payment_date,
-            "payment_status": self.payment_status,
-            "user": {
-                "username": self.user.username,
-                "email": self.user.email,
-                "phone": self.user.phone,
-                "role": self.user.role,
-                "date_joined": self.user.date_joined
-            }
-        }
-        return payment_dict
-
 # ExtraResource model
 class ExtraResource(db.Model, SerializerMixin):
     __tablename__ = 'extra_resources'
+    serialize_rules = ('-job.applications', '-job.extra_resources')
 
     id = db.Column(db.Integer, primary_key=True)
-    job_id = db.Column(db.Integer, db.ForeignKey('jobs.id'), nullable=False)
+    job_id = db.Column(db.Integer, db.ForeignKey('jobs.id'), nullable=False, index=True)
     resource_name = db.Column(db.String(120), nullable=False)
     description = db.Column(db.Text)
     resource_type = db.Column(db.String(50), nullable=False)
 
-    job = db.relationship('Job', back_populates='extra_resources')
-
-    def to_dict(self):
-        resource_dict = {
-            "resource_name": self.resource_name,
-            "description": self.description,
-            "resource_type": self.resource_type,
-            "job": {
-                "title": self.job.title,
-                "description": self.job.description,
-                "location": self.job.location,
-                "salary_min": self.job.salary_min,
-                "salary_max": self.job.salary_max,
-                "job_type": self.job.job_type,
-                "skills_required": self.job.skills_required,
-                "benefits": self.job.benefits,
-                "application_deadline": self.job.application_deadline,
-                "employer": self.job.employer,
-                "employer_email": self.job.employer_email,
-                "employer_phone": self.job.employer_phone,
-                "date_posted": self.job.date_posted,
-                "is_active": self.job.is_active
-            }
-        }
-        return resource_dict
\ No newline at end of file
+    job = db.relationship('Job', back_populates='extra_resources', lazy='select')
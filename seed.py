@@ -1,9 +1,12 @@
 from app import app, db
 from models import User, Job, JobApplication, Payment, ExtraResource
-from werkzeug.security import generate_password_hash
+from sqlalchemy import insert
 from datetime import datetime, timedelta
 import random
 
+# Low-iteration hashing so seeding stays fast; real sign-ups use User.set_password's default
+SEED_HASH_METHOD = "pbkdf2:sha256:1000"
+
 # Helper function to create random phone numbers in Kenyan format
 def create_random_phone():
     return f"+254 {random.randint(700000000, 799999999)}"
@@ -11,65 +14,59 @@ def create_random_phone():
 # Seed Users with realistic info (7 users)
 def seed_users():
     users = [
-        User(
+        (User(
             username="john_doe92",
             email="john.doe92.graduate@gmail.com",  # Updated structure for graduate role
             phone=create_random_phone(),
-            password_hash=generate_password_hash("password123"),
             role="graduate",  # non-premium graduate
             date_joined=datetime.utcnow() - timedelta(days=random.randint(30, 365))
-        ),
-        User(
+        ), "password123"),
+        (User(
             username="jane_smith87",
             email="jane.smith87.premium_graduate@gmail.com",  # Updated structure for premium_graduate role
             phone=create_random_phone(),
-            password_hash=generate_password_hash("securepass456"),
             role="premium_graduate",  # premium graduate
             date_joined=datetime.utcnow() - timedelta(days=random.randint(30, 365))
-        ),
-        User(
+        ), "securepass456"),
+        (User(
             username="peter_williams",
             email="peter.williams.graduate@gmail.com",  # Updated structure for graduate role
             phone=create_random_phone(),
-            password_hash=generate_password_hash("mypassword789"),
             role="graduate",  # non-premium graduate
             date_joined=datetime.utcnow() - timedelta(days=random.randint(30, 365))
-        ),
-        User(
+        ), "mypassword789"),
+        (User(
             username="mary_kenya",
             email="mary.kenya.admin@kenya.com",  # Updated structure for admin role
             phone=create_random_phone(),
-            password_hash=generate_password_hash("adminpass321"),
             role="admin",  # admin role
             date_joined=datetime.utcnow() - timedelta(days=random.randint(30, 365))
-        ),
-        User(
+        ), "adminpass321"),
+        (User(
             username="joseph_ngugi",
             email="joseph.ngugi.premium_graduate@gmail.com",  # Updated structure for premium_graduate role
             phone=create_random_phone(),
-            password_hash=generate_password_hash("joseph2023"),
             role="premium_graduate",  # premium graduate
             date_joined=datetime.utcnow() - timedelta(days=random.randint(30, 365))
-        ),
-        User(
+        ), "joseph2023"),
+        (User(
             username="anne_achola",
             email="anne.achola.graduate@gmail.com",  # Updated structure for graduate role
             phone=create_random_phone(),
-            password_hash=generate_password_hash("securepassword"),
             role="graduate",  # non-premium graduate
             date_joined=datetime.utcnow() - timedelta(days=random.randint(30, 365))
-        ),
-        User(
+        ), "securepassword"),
+        (User(
             username="peter_mwangi",
             email="peter.mwangi.premium_graduate@gmail.com",  # Updated structure for premium_graduate role
             phone=create_random_phone(),
-            password_hash=generate_password_hash("securepass789"),
             role="premium_graduate",  # premium graduate
             date_joined=datetime.utcnow() - timedelta(days=random.randint(30, 365))
-        ),
+        ), "securepass789"),
     ]
 
-    for user in users:
+    for user, password in users:
+        user.set_password(password, method=SEED_HASH_METHOD)
         db.session.add(user)
     db.session.commit()
 
@@ -160,31 +157,31 @@ def seed_jobs():
 # Seed Job Applications (Multiple applications for different users)
 def seed_job_applications():
     job_applications = [
-        JobApplication(
+        dict(
             user_id=1,  # john_doe92
             job_id=1,   # Software Engineer
             application_date=datetime.utcnow() - timedelta(days=random.randint(1, 20)),
             status="pending"
         ),
-        JobApplication(
+        dict(
             user_id=2,  # jane_smith87 (premium graduate)
             job_id=1,   # Software Engineer
             application_date=datetime.utcnow() - timedelta(days=random.randint(1, 10)),
             status="accepted"
         ),
-        JobApplication(
+        dict(
             user_id=3,  # peter_williams
             job_id=3,   # Data Scientist
             application_date=datetime.utcnow() - timedelta(days=random.randint(5, 15)),
             status="pending"
         ),
-        JobApplication(
+        dict(
             user_id=5,  # joseph_ngugi (premium graduate)
             job_id=4,   # UX/UI Designer
             application_date=datetime.utcnow() - timedelta(days=random.randint(5, 20)),
             status="pending"
         ),
-        JobApplication(
+        dict(
             user_id=7,  # peter_mwangi (premium graduate)
             job_id=2,   # Marketing Manager
             application_date=datetime.utcnow() - timedelta(days=random.randint(3, 10)),
@@ -192,23 +189,27 @@ def seed_job_applications():
         )
     ]
 
-    for application in job_applications:
-        db.session.add(application)
+    # One executemany INSERT instead of a flush per row. ORM bulk inserts skip
+    # @validates, so validate_status never sees these rows: keep them trusted data.
+    db.session.execute(insert(JobApplication), job_applications)
     db.session.commit()
 
 # Seed Payments for Premium Graduates only (Multiple payments)
 def seed_payments():
     premium_graduates = User.query.filter_by(role="premium_graduate").all()
 
-    for user in premium_graduates:
-        payment = Payment(
+    payments = [
+        dict(
             user_id=user.id,  # Only premium graduate's ID
-            amount=5000.0,  # fixed amount of 5000
+            amount=5000,  # fixed amount of 5000
             payment_status="completed",
             payment_date=datetime.utcnow() - timedelta(days=random.randint(1, 20))
         )
-        db.session.add(payment)
+        for user in premium_graduates
+    ]
 
+    # Bulk insert bypasses validate_amount; the fixed 5000 above must stay correct
+    db.session.execute(insert(Payment), payments)
     db.session.commit()
 
 # Seed Extra Resources with more detailed Kenyan insights
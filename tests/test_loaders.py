@@ -0,0 +1,63 @@
+from datetime import datetime, timedelta
+
+import pytest
+from flask import Flask
+from sqlalchemy import select
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.orm import raiseload
+
+from app import USER_LOADERS, JOB_LOADERS, PAYMENT_LOADERS
+from models import db, User, Job, JobApplication, Payment, ExtraResource
+
+
+@pytest.fixture
+def session():
+    test_app = Flask(__name__)
+    test_app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite://'
+    db.init_app(test_app)
+
+    with test_app.app_context():
+        db.create_all()
+        user = User(username="john_doe92", email="john@example.com", role="graduate")
+        user.set_password("password123", method="pbkdf2:sha256:1000")
+        job = Job(
+            title="Software Engineer",
+            description="Build things",
+            location="Nairobi, Kenya",
+            job_type="Full-time",
+            application_deadline=datetime.utcnow() + timedelta(days=30),
+            employer="Safaricom",
+            employer_email="hr@safaricom.co.ke",
+        )
+        db.session.add_all([
+            user,
+            job,
+            JobApplication(user=user, job=job, status="pending"),
+            Payment(user=user, amount=5000),
+            ExtraResource(job=job, resource_name="Interview prep", resource_type="Guide"),
+        ])
+        db.session.commit()
+        db.session.expunge_all()
+
+        yield db.session
+
+        db.session.remove()
+        db.drop_all()
+
+
+def test_to_dict_without_eager_loading_raises(session):
+    user = session.execute(select(User).options(raiseload('*'))).scalars().one()
+
+    with pytest.raises(InvalidRequestError):
+        user.to_dict()
+
+
+@pytest.mark.parametrize('model, loaders', [
+    (User, USER_LOADERS),
+    (Job, JOB_LOADERS),
+    (Payment, PAYMENT_LOADERS),
+])
+def test_loaders_cover_serialize_rules(session, model, loaders):
+    rows = session.execute(select(model).options(*loaders)).scalars().all()
+
+    assert [row.to_dict() for row in rows]
@@ -0,0 +1,31 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from models import Job, Payment
+
+
+def test_past_application_deadline_is_rejected():
+    now = datetime.utcnow()
+
+    with pytest.raises(ValueError):
+        Job(date_posted=now - timedelta(days=10), application_deadline=now - timedelta(days=5))
+
+
+def test_future_application_deadline_is_accepted():
+    deadline = datetime.utcnow() + timedelta(days=30)
+
+    assert Job(application_deadline=deadline).application_deadline == deadline
+
+
+@pytest.mark.parametrize('salary', [1500.7, 1500.0, True])
+def test_non_integer_salary_is_rejected(salary):
+    with pytest.raises(ValueError):
+        Job(salary_min=salary)
+
+
+def test_payment_amount_must_be_integer():
+    assert Payment(amount=5000).amount == 5000
+
+    with pytest.raises(ValueError):
+        Payment(amount=5000.0)